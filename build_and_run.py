@@ -6,19 +6,415 @@ Automates dependency installation, web build, and Electron app launch.
 
 import os
 import sys
+import shutil
+import signal
 import subprocess
-import platform
 import argparse
+import asyncio
+import concurrent.futures
+import multiprocessing
+import select
 import socket
+import struct
 import threading
 import time
 from pathlib import Path
 
+_IS_WINDOWS = sys.platform.startswith("win")
+_NPM_CMD = "npm.cmd" if _IS_WINDOWS else "npm"
+
+# Signals the interpreter ignores that children spawned with posix_spawn must get back
+# at their defaults, as subprocess does, so pipelines in npm scripts end on SIGPIPE
+_SPAWN_SIGDEF = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, name)
+)
+
+# Sample files seeded into the TFTP root (stored as bytes, written as-is)
+_TFTP_SAMPLE_FILES = {
+    "test_file.txt": b"QuantumXfer TFTP Test File\nThis file is used for testing TFTP transfers.\n",
+    "README.txt": b"TFTP Root Directory\n\nThis directory contains files for TFTP testing.\n",
+}
+
+# TFTP (RFC 1350) opcodes and transfer settings for the built-in server
+_TFTP_RRQ, _TFTP_WRQ, _TFTP_DATA, _TFTP_ACK, _TFTP_ERROR = 1, 2, 3, 4, 5
+_TFTP_BLOCK_SIZE = 512
+_TFTP_TIMEOUT = 1.0
+_TFTP_RETRIES = 5
+
+# Precompiled packet layouts: bare opcode, and opcode + block number / error code
+_TFTP_OPCODE = struct.Struct(">H")
+_TFTP_HEADER = struct.Struct(">HH")
+
+# Request opcode -> whether the client is uploading (WRQ) rather than downloading (RRQ)
+_TFTP_REQUESTS = {_TFTP_RRQ: False, _TFTP_WRQ: True}
+
+# Read request for the sample file, used by the readiness probe and --test-tftp
+_TFTP_PROBE_RRQ = _TFTP_OPCODE.pack(_TFTP_RRQ) + b"test_file.txt\x00octet\x00"
+
+
+def _tftp_error(code, message):
+    """Build a TFTP ERROR packet."""
+    return _TFTP_HEADER.pack(_TFTP_ERROR, code) + message.encode("ascii") + b"\x00"
+
+
+class _TftpTransfer(asyncio.DatagramProtocol):
+    """A single TFTP read or write, served from its own ephemeral port (the server TID)."""
+
+    def __init__(self, loop, path, upload, on_finish=None):
+        self.loop = loop
+        self.path = path
+        self.upload = upload
+        self.on_finish = on_finish
+        self.transport = None
+        self.file = None
+        self.block = 0
+        self.final = False
+        self.last_packet = None
+        self.retries = 0
+        self.timer = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        try:
+            # Uploads never overwrite existing files
+            self.file = open(self.path, "xb" if self.upload else "rb")
+        except FileNotFoundError:
+            self._fail(1, "File not found")
+            return
+        except FileExistsError:
+            self._fail(6, "File already exists")
+            return
+        except OSError:
+            self._fail(2, "Access violation")
+            return
+
+        if self.upload:
+            self._send(_TFTP_HEADER.pack(_TFTP_ACK, 0))
+        else:
+            self._send_next_block()
+
+    def _on_ack(self, block, data):
+        if self.upload or block != self.block:
+            return
+        if self.final:
+            self._finish()
+        else:
+            self._send_next_block()
+
+    def _on_data(self, block, data):
+        if not self.upload:
+            return
+        if block == (self.block + 1) & 0xFFFF:
+            payload = data[4:]
+            self.file.write(payload)
+            self.block = block
+            ack = _TFTP_HEADER.pack(_TFTP_ACK, block)
+            if len(payload) < _TFTP_BLOCK_SIZE:
+                # Close the file before the client sees the final ACK
+                self._finish(ack)
+            else:
+                self._send(ack)
+        elif block == self.block:
+            # Our ACK was lost; repeat it
+            self.transport.sendto(self.last_packet)
+
+    def _on_error(self, block, data):
+        self._finish()
+
+    _HANDLERS = {_TFTP_ACK: _on_ack, _TFTP_DATA: _on_data, _TFTP_ERROR: _on_error}
+
+    def datagram_received(self, data, addr):
+        if len(data) < 4:
+            return
+        opcode, block = _TFTP_HEADER.unpack_from(data)
+        handler = self._HANDLERS.get(opcode)
+        if handler is not None:
+            handler(self, block, data)
+
+    def error_received(self, exc):
+        self._finish()
+
+    def _send_next_block(self):
+        chunk = self.file.read(_TFTP_BLOCK_SIZE)
+        self.block = (self.block + 1) & 0xFFFF
+        self.final = len(chunk) < _TFTP_BLOCK_SIZE
+        self._send(_TFTP_HEADER.pack(_TFTP_DATA, self.block) + chunk)
+
+    def _send(self, packet):
+        self.last_packet = packet
+        self.retries = 0
+        self.transport.sendto(packet)
+        self._arm_timer()
+
+    def _arm_timer(self):
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = self.loop.call_later(_TFTP_TIMEOUT, self._retransmit)
+
+    def _retransmit(self):
+        self.retries += 1
+        if self.retries > _TFTP_RETRIES:
+            self._finish()
+            return
+        self.transport.sendto(self.last_packet)
+        self._arm_timer()
+
+    def _fail(self, code, message):
+        self._finish(_tftp_error(code, message))
+
+    def _finish(self, packet=None):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if packet is not None:
+            self.transport.sendto(packet)
+        self.transport.close()
+        if self.on_finish is not None:
+            self.on_finish()
+            self.on_finish = None
+
+
+class _TftpServerProtocol(asyncio.DatagramProtocol):
+    """Listens on the TFTP port and starts a _TftpTransfer for each request."""
+
+    def __init__(self, loop, root, host):
+        self.loop = loop
+        # Kept as bytes so request filenames are resolved without decoding them
+        self.root = os.path.realpath(os.fsencode(root))
+        self.host = host
+        self.transport = None
+        # Active transfers keyed by client (address, port), i.e. the client TID
+        self.transfers = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        if len(data) < 2 or addr in self.transfers:
+            # A client retransmitting its request is already being served
+            return
+        upload = _TFTP_REQUESTS.get(_TFTP_OPCODE.unpack_from(data)[0])
+        if upload is None:
+            self.transport.sendto(_tftp_error(4, "Illegal TFTP operation"), addr)
+            return
+
+        fields = data[2:].split(b"\x00")
+        if len(fields) < 3:
+            self.transport.sendto(_tftp_error(4, "Malformed request"), addr)
+            return
+
+        # Mode (netascii/octet) is ignored: files are always sent as-is
+        path = self._resolve(fields[0])
+        if path is None:
+            self.transport.sendto(_tftp_error(2, "Access violation"), addr)
+            return
+
+        transfer = _TftpTransfer(
+            self.loop, path, upload=upload,
+            on_finish=lambda: self.transfers.pop(addr, None),
+        )
+        self.transfers[addr] = transfer
+        self.loop.create_task(self._open_transfer(transfer, addr))
+
+    async def _open_transfer(self, transfer, addr):
+        try:
+            await self.loop.create_datagram_endpoint(
+                lambda: transfer, local_addr=(self.host, 0), remote_addr=addr
+            )
+        except OSError:
+            self.transfers.pop(addr, None)
+
+    def _resolve(self, filename):
+        """Map a requested filename into the TFTP root, rejecting paths that escape it."""
+        name = filename.lstrip(b"/\\")
+        path = os.path.realpath(os.path.join(self.root, name))
+        try:
+            inside = os.path.commonpath([self.root, path]) == self.root
+        except ValueError:
+            # Windows: the request named another drive (D:\x or D:x)
+            return None
+        if not inside or path == self.root:
+            return None
+        return path
+
+    def close(self):
+        """Abort all active transfers and stop listening."""
+        for transfer in list(self.transfers.values()):
+            if transfer.transport is not None:
+                transfer._finish()
+        self.transfers.clear()
+        if self.transport is not None:
+            self.transport.close()
+
+
+class _TftpServerThread:
+    """Popen-style handle for the built-in TFTP server running on its own event loop thread."""
+
+    def __init__(self, sock, root):
+        self.loop = asyncio.new_event_loop()
+        self.protocol = _TftpServerProtocol(self.loop, root, sock.getsockname()[0])
+        # Create the endpoint before the thread starts: a stop requested by terminate()
+        # can then only be consumed by run_forever(), never by this setup step
+        try:
+            self.loop.run_until_complete(
+                self.loop.create_datagram_endpoint(lambda: self.protocol, sock=sock)
+            )
+        except BaseException:
+            sock.close()
+            self.loop.close()
+            raise
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.protocol.close()
+            # Let the transports' close callbacks run before the loop goes away
+            self.loop.run_until_complete(asyncio.sleep(0))
+            self.loop.close()
+
+    def terminate(self):
+        """Ask the event loop to stop."""
+        if self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def wait(self, timeout=None):
+        """
+        Wait for the server thread to finish.
+
+        Args:
+            timeout (float): Seconds to wait before raising subprocess.TimeoutExpired.
+
+        Returns:
+            int: Always 0.
+        """
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            raise subprocess.TimeoutExpired("built-in TFTP server", timeout)
+        return 0
+
+
+def _copy_output(source_fd, target_fds):
+    """
+    Copy raw bytes from a pipe to each target file descriptor until EOF.
+
+    A target that fails to accept a write (console piped into a closed reader,
+    full disk) is dropped, but the pipe is always drained so the child writing
+    into it can never block on the tee.
+    """
+    targets = list(target_fds)
+    while True:
+        chunk = os.read(source_fd, 65536)
+        if not chunk:
+            return
+        for fd in list(targets):
+            view = memoryview(chunk)
+            try:
+                while view:
+                    view = view[os.write(fd, view):]
+            except OSError:
+                targets.remove(fd)
+
+
+# Seconds _spawn_tee waits for the copier to drain a finished command's output
+_TEE_DRAIN_TIMEOUT = 0.5
+
+
+class _SpawnedProcess:
+    """Minimal Popen-style handle for a background child started with os.posix_spawnp."""
+
+    def __init__(self, pid, args):
+        self.pid = pid
+        self.args = args
+        self.returncode = None
+        # A pidfd keeps signals pointed at this child even if its PID is later reused
+        self.pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                self.pidfd = os.pidfd_open(pid)
+            except OSError:
+                pass
+
+    @classmethod
+    def spawn(cls, args):
+        """
+        Start a command found on PATH in its own session with stdout/stderr discarded.
+
+        Args:
+            args (list): Command and arguments as a list.
+
+        Returns:
+            _SpawnedProcess: Handle for the running child.
+        """
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ]
+        pid = os.posix_spawnp(
+            args[0], args, os.environ,
+            file_actions=file_actions, setsid=True, setsigdef=_SPAWN_SIGDEF,
+        )
+        return cls(pid, args)
+
+    def terminate(self):
+        """Send SIGTERM to the child."""
+        if self.returncode is not None:
+            return
+        if self.pidfd is not None and hasattr(signal, "pidfd_send_signal"):
+            signal.pidfd_send_signal(self.pidfd, signal.SIGTERM)
+        else:
+            os.kill(self.pid, signal.SIGTERM)
+
+    def wait(self, timeout=None):
+        """
+        Wait for the child to exit.
+
+        Args:
+            timeout (float): Seconds to wait before raising subprocess.TimeoutExpired.
+
+        Returns:
+            int: Return code of the child (negative signal number if killed).
+        """
+        if self.returncode is None and self.pidfd is not None:
+            # The pidfd turns readable when the child exits, so block on it instead of polling
+            ready, _, _ = select.select([self.pidfd], [], [], timeout)
+            if not ready:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            _, status = os.waitpid(self.pid, 0)
+            self._set_returncode(status)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.returncode is None:
+            pid, status = os.waitpid(self.pid, 0 if deadline is None else os.WNOHANG)
+            if pid:
+                self._set_returncode(status)
+            elif time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            else:
+                time.sleep(0.05)
+        return self.returncode
+
+    def _set_returncode(self, status):
+        if os.WIFSIGNALED(status):
+            self.returncode = -os.WTERMSIG(status)
+        else:
+            self.returncode = os.WEXITSTATUS(status)
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
+
 
 class QuantumXferBuilder:
     """Builder class for QuantumXfer Electron application."""
 
-    def __init__(self, project_root=None, skip_install=False, skip_build=False, dev_mode=False):
+    def __init__(self, project_root=None, skip_install=False, skip_build=False, dev_mode=False,
+                 log_file=None):
         """
         Initialize the builder.
 
@@ -27,16 +423,32 @@ class QuantumXferBuilder:
             skip_install (bool): Skip npm install step.
             skip_build (bool): Skip npm build step.
             dev_mode (bool): Run in development mode with hot reload (electron:dev).
+            log_file (str): Also append the output of every command to this file.
         """
-        self.project_root = Path(project_root or os.getcwd()).resolve()
+        # abspath is purely lexical; unlike Path.resolve it does not stat every path component
+        root = os.path.abspath(project_root or os.getcwd())
+        self.project_root = Path(root)
         self.skip_install = skip_install
         self.skip_build = skip_build
         self.dev_mode = dev_mode
-        self.is_windows = platform.system() == "Windows"
-        self.npm_cmd = "npm.cmd" if self.is_windows else "npm"
-
-        # Validate project structure
-        if not (self.project_root / "package.json").exists():
+        self.log_file = log_file
+        self.is_windows = _IS_WINDOWS
+        self.npm_cmd = _NPM_CMD
+        # Resolve npm against PATH once; every spawn then execs the absolute path directly
+        self.npm_path = shutil.which(self.npm_cmd) or self.npm_cmd
+        self.npm_version = None
+        self._npm_probe = None
+
+        # Environment for npm children: skip the update-notifier registry check each npm start
+        # pays, and the progress bar redraws during installs
+        self.npm_env = dict(os.environ)
+        self.npm_env.setdefault("NPM_CONFIG_UPDATE_NOTIFIER", "false")
+        self.npm_env.setdefault("NPM_CONFIG_PROGRESS", "false")
+
+        # Validate project structure (a single stat)
+        try:
+            os.stat(os.path.join(root, "package.json"))
+        except OSError:
             raise FileNotFoundError(f"package.json not found in {self.project_root}")
 
         # TFTP Server state
@@ -44,13 +456,15 @@ class QuantumXferBuilder:
         self.tftp_port = 69
         self.tftp_root = self.project_root / "tftp_root"
 
-    def run_command(self, cmd, description=None):
+    def run_command(self, cmd, description=None, tee=None):
         """
         Run a shell command and handle errors.
 
         Args:
             cmd (list): Command and arguments as a list.
             description (str): Human-readable description of the command.
+            tee (str): File to append the command's output to, in addition to the
+                console. Defaults to the builder's log_file.
 
         Returns:
             int: Return code of the command.
@@ -62,26 +476,192 @@ class QuantumXferBuilder:
 
         print(f"Running: {' '.join(cmd)}\n")
 
+        tee = tee or self.log_file
         try:
-            result = subprocess.run(cmd, cwd=self.project_root, check=False)
-            return result.returncode
+            if tee:
+                return self._spawn_tee(cmd, tee)
+            return self._spawn(cmd)
         except FileNotFoundError as e:
             print(f"❌ Error: Command not found. Make sure you have Node.js and npm installed.")
             print(f"   Details: {e}")
             return 1
 
+    def _spawn_tee(self, cmd, log_path):
+        """
+        Run a command with its stdout and stderr copied to the console and a log file.
+
+        The child writes into a pipe; a background thread forwards the raw bytes
+        with os.read/os.write, so output is never decoded or split into lines.
+        The call returns once the child exits and its output is drained. If a
+        background grandchild still holds the pipe, the copier keeps forwarding
+        its output until EOF instead of blocking the caller.
+
+        Args:
+            cmd (list): Command and arguments as a list.
+            log_path (str): File the output is appended to.
+
+        Returns:
+            int: Return code of the command.
+        """
+        # Anything still buffered by print() must reach the console before the child's output
+        sys.stdout.flush()
+        log = open(log_path, "ab")
+        try:
+            read_fd, write_fd = os.pipe()
+        except OSError:
+            log.close()
+            raise
+
+        def tee():
+            # The copier owns the read end and the log, since it may outlive this call
+            try:
+                _copy_output(read_fd, (sys.stdout.fileno(), log.fileno()))
+            finally:
+                os.close(read_fd)
+                log.close()
+
+        copier = threading.Thread(target=tee, daemon=True)
+        copier.start()
+        try:
+            return self._spawn(cmd, output_fd=write_fd)
+        finally:
+            # Closing our write end lets the copier see EOF once the child's output is
+            # drained; only wait briefly, as a background grandchild may keep it open
+            os.close(write_fd)
+            copier.join(_TEE_DRAIN_TIMEOUT)
+
+    def _spawn(self, cmd, output_fd=None):
+        """
+        Launch a command in the project root and wait for it to exit.
+
+        Uses os.posix_spawn where available so the child is created without
+        copying the interpreter's page tables (fork+exec). Python exposes no
+        chdir spawn action, so the fast path is only taken when the project
+        root is already the working directory; otherwise subprocess.run is used.
+
+        Args:
+            cmd (list): Command and arguments as a list.
+            output_fd (int): Descriptor to receive the child's stdout and stderr.
+                Defaults to inheriting the console.
+
+        Returns:
+            int: Return code of the command (negative signal number if killed).
+        """
+        def run_fallback():
+            if output_fd is None:
+                stdout = stderr = None
+            else:
+                stdout, stderr = output_fd, subprocess.STDOUT
+            return subprocess.run(
+                cmd, cwd=self.project_root, env=self.npm_env, stdout=stdout, stderr=stderr,
+                check=False,
+            ).returncode
+
+        executable = shutil.which(cmd[0])
+        if (
+            not hasattr(os, "posix_spawn")
+            or executable is None
+            or os.getcwd() != str(self.project_root)
+        ):
+            return run_fallback()
+
+        file_actions = []
+        if output_fd is not None:
+            file_actions = [
+                (os.POSIX_SPAWN_DUP2, output_fd, 1),
+                (os.POSIX_SPAWN_DUP2, output_fd, 2),
+            ]
+        try:
+            pid = os.posix_spawn(
+                executable, cmd, self.npm_env, file_actions=file_actions, setsigdef=_SPAWN_SIGDEF
+            )
+        except OSError:
+            return run_fallback()
+
+        try:
+            _, status = os.waitpid(pid, 0)
+        except BaseException:
+            # Mirror subprocess.run: give the child (which got the same Ctrl+C) a short
+            # grace period to exit, then kill it so it is never left behind
+            deadline = time.monotonic() + 0.25
+            while os.waitpid(pid, os.WNOHANG)[0] == 0:
+                if time.monotonic() >= deadline:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                    break
+                time.sleep(0.01)
+            raise
+
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status)
+        return os.WEXITSTATUS(status)
+
+    def _probe_npm_version(self):
+        """Run npm --version and return the version string, or None if npm is unusable."""
+        # Only stdout is piped; the short version string is plain ASCII
+        try:
+            output = subprocess.check_output(
+                [self.npm_path, "--version"],
+                stderr=subprocess.DEVNULL,
+                env=self.npm_env,
+                timeout=15,
+            )
+        except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return None
+        # Strip as bytes and decode leniently: stray bytes from npm must not raise here
+        return output.strip().decode("ascii", "replace")
+
+    def prefetch_npm_version(self):
+        """Start the npm version probe in the background so it overlaps other startup work."""
+        if self.npm_version is not None or self._npm_probe is not None:
+            return
+
+        future = concurrent.futures.Future()
+
+        def probe():
+            try:
+                future.set_result(self._probe_npm_version())
+            except BaseException as e:
+                future.set_exception(e)
+
+        # A daemon thread, unlike an executor worker, never holds up interpreter exit
+        threading.Thread(target=probe, daemon=True).start()
+        self._npm_probe = future
+
+    def needs_npm_check(self, build_only=False):
+        """
+        Tell whether the selected pipeline will call check_node_npm.
+
+        Args:
+            build_only (bool): The --build-only pipeline, which always checks.
+
+        Returns:
+            bool: False when nothing will be installed or built, so there is nothing to probe for.
+        """
+        if build_only:
+            return True
+        # Dev mode never runs the production build (see build_and_run)
+        return not (self.skip_install and (self.skip_build or self.dev_mode))
+
     def check_node_npm(self):
-        """Check if Node.js and npm are installed."""
+        """Check if Node.js and npm are installed. The result is cached on success."""
+        if self.npm_version is not None:
+            return True
+
         print("🔍 Checking Node.js and npm installation...")
 
-        # Check node
-        node_check = subprocess.run([self.npm_cmd, "--version"], capture_output=True, text=True)
-        if node_check.returncode != 0:
+        if self._npm_probe is not None:
+            npm_version = self._npm_probe.result()
+            self._npm_probe = None
+        else:
+            npm_version = self._probe_npm_version()
+
+        if npm_version is None:
             print("❌ npm not found. Please install Node.js and npm first.")
             return False
 
-        npm_version = node_check.stdout.strip()
-        print(f"✅ npm version: {npm_version}")
+        self.npm_version = npm_version
+        print(f"✅ npm version: {self.npm_version}")
         return True
 
     def install_dependencies(self):
@@ -90,7 +670,8 @@ class QuantumXferBuilder:
             print("⏭️  Skipping npm install (--skip-install flag set)")
             return 0
 
-        cmd = [self.npm_cmd, "ci"]
+        # Use the local cache first and skip the audit/funding registry round-trips
+        cmd = [self.npm_path, "ci", "--prefer-offline", "--no-audit", "--no-fund"]
         return self.run_command(cmd, "Installing Dependencies (npm ci)")
 
     def build_web_assets(self):
@@ -99,16 +680,16 @@ class QuantumXferBuilder:
             print("⏭️  Skipping build (--skip-build flag set)")
             return 0
 
-        cmd = [self.npm_cmd, "run", "build"]
+        cmd = [self.npm_path, "run", "build"]
         return self.run_command(cmd, "Building Web Assets (TypeScript + Vite)")
 
     def run_electron(self):
         """Launch the Electron application."""
         if self.dev_mode:
-            cmd = [self.npm_cmd, "run", "electron:dev"]
+            cmd = [self.npm_path, "run", "electron:dev"]
             description = "Running Electron (Dev Mode with Hot Reload)"
         else:
-            cmd = [self.npm_cmd, "run", "electron"]
+            cmd = [self.npm_path, "run", "electron"]
             description = "Running Electron (Production Build)"
 
         return self.run_command(cmd, description)
@@ -120,7 +701,7 @@ class QuantumXferBuilder:
         print("🚀 " * 20 + "\n")
 
         # Check prerequisites
-        if not self.check_node_npm():
+        if self.needs_npm_check() and not self.check_node_npm():
             return 1
 
         # Install dependencies
@@ -128,8 +709,11 @@ class QuantumXferBuilder:
             print("❌ Failed to install dependencies")
             return 1
 
-        # Build web assets
-        if self.build_web_assets() != 0:
+        # Build web assets (dev mode serves the renderer from the Vite dev server,
+        # so the production build would never be loaded)
+        if self.dev_mode and not self.skip_build:
+            print("⏭️  Skipping build (dev mode serves assets from the Vite dev server)")
+        elif self.build_web_assets() != 0:
             print("❌ Failed to build web assets")
             return 1
 
@@ -160,11 +744,11 @@ class QuantumXferBuilder:
         print("="*60 + "\n")
 
         if target_platform == "all":
-            cmd = [self.npm_cmd, "run", "electron:build:all"]
+            cmd = [self.npm_path, "run", "electron:build:all"]
         elif target_platform == "win":
-            cmd = [self.npm_cmd, "run", "electron:build:win"]
+            cmd = [self.npm_path, "run", "electron:build:win"]
         elif target_platform == "linux":
-            cmd = [self.npm_cmd, "run", "electron:build:linux"]
+            cmd = [self.npm_path, "run", "electron:build:linux"]
         else:
             print(f"❌ Unknown platform: {target_platform}")
             return 1
@@ -175,15 +759,14 @@ class QuantumXferBuilder:
         """Create TFTP root directory and sample files for testing."""
         self.tftp_root.mkdir(exist_ok=True)
         
-        # Create sample test files
-        sample_file = self.tftp_root / "test_file.txt"
-        if not sample_file.exists():
-            sample_file.write_text("QuantumXfer TFTP Test File\nThis file is used for testing TFTP transfers.\n")
-        
-        readme_file = self.tftp_root / "README.txt"
-        if not readme_file.exists():
-            readme_file.write_text("TFTP Root Directory\n\nThis directory contains files for TFTP testing.\n")
-        
+        # Create sample test files; exclusive-create mode leaves existing files untouched
+        for name, content in _TFTP_SAMPLE_FILES.items():
+            try:
+                with open(self.tftp_root / name, "xb") as f:
+                    f.write(content)
+            except FileExistsError:
+                pass
+
         print(f"✅ TFTP root directory: {self.tftp_root}")
         return self.tftp_root
 
@@ -207,9 +790,12 @@ class QuantumXferBuilder:
             else:
                 self._start_tftp_unix(tftp_root)
             
-            # Give server time to start
-            time.sleep(1)
-            print(f"✅ TFTP Server started on port {self.tftp_port}")
+            # The built-in server's socket is bound before its thread starts, so it is
+            # ready immediately; external daemons are probed until they answer
+            if isinstance(self.tftp_process, _TftpServerThread) or self._wait_for_tftp():
+                print(f"✅ TFTP Server started on port {self.tftp_port}")
+            else:
+                print(f"⚠️  TFTP Server launched but not responding yet on port {self.tftp_port}")
             print(f"   Root directory: {tftp_root}")
             return True
         except Exception as e:
@@ -217,31 +803,50 @@ class QuantumXferBuilder:
             print("   Continuing without TFTP server...")
             return False
 
-    def _start_tftp_windows(self, tftp_root):
-        """Start TFTP server on Windows using available tools."""
-        try:
-            # Try using Trivial Daemon TFTP server (tftpd32 or tftpd64) if available
-            self.tftp_process = subprocess.Popen(
-                ["python", "-m", "tftpy"],
-                cwd=tftp_root,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            return
-        except FileNotFoundError:
-            pass
+    def _wait_for_tftp(self, attempts=25, interval=0.02):
+        """
+        Poll the TFTP server until it answers a read request.
 
-        # Fallback: create a simple Python TFTP server thread
+        Args:
+            attempts (int): Maximum number of probes to send.
+            interval (float): Seconds to wait for a reply to each probe.
+
+        Returns:
+            bool: True once the server responds, False if it never did.
+        """
+        for _ in range(attempts):
+            if self._probe_tftp(interval) is not None:
+                return True
+        return False
+
+    def _probe_tftp(self, timeout):
+        """
+        Send a TFTP read request for the sample file and wait for the reply.
+
+        Args:
+            timeout (float): Seconds to wait for a reply.
+
+        Returns:
+            tuple: (data, addr) of the reply, or None if nothing arrived in time.
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(timeout)
+            try:
+                sock.sendto(_TFTP_PROBE_RRQ, ("127.0.0.1", self.tftp_port))
+                return sock.recvfrom(512)
+            except (socket.timeout, ConnectionError):
+                return None
+
+    def _start_tftp_windows(self, tftp_root):
+        """Start TFTP server on Windows using the built-in server."""
         self._start_python_tftp_server(tftp_root)
 
     def _start_tftp_unix(self, tftp_root):
         """Start TFTP server on Unix-like systems (Linux, macOS)."""
         try:
             # Try dnsmasq if available
-            self.tftp_process = subprocess.Popen(
-                ["dnsmasq", "--tftp-root", str(tftp_root), "--tftp-port", str(self.tftp_port)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+            self.tftp_process = self._spawn_background(
+                ["dnsmasq", "--tftp-root", str(tftp_root), "--tftp-port", str(self.tftp_port)]
             )
             return
         except FileNotFoundError:
@@ -249,10 +854,8 @@ class QuantumXferBuilder:
 
         try:
             # Try atftpd
-            self.tftp_process = subprocess.Popen(
-                ["atftpd", "--bind-address", "127.0.0.1", "--port", str(self.tftp_port), str(tftp_root)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+            self.tftp_process = self._spawn_background(
+                ["atftpd", "--bind-address", "127.0.0.1", "--port", str(self.tftp_port), str(tftp_root)]
             )
             return
         except FileNotFoundError:
@@ -261,32 +864,48 @@ class QuantumXferBuilder:
         # Fallback: create a simple Python TFTP server thread
         self._start_python_tftp_server(tftp_root)
 
+    def _spawn_background(self, cmd):
+        """
+        Start a background helper process with its output discarded.
+
+        Uses os.posix_spawnp in a new session where available, so the child is
+        created without a fork of the interpreter; otherwise subprocess.Popen.
+
+        Args:
+            cmd (list): Command and arguments as a list.
+
+        Returns:
+            Handle with terminate() and wait(timeout) methods.
+        """
+        if hasattr(os, "posix_spawnp"):
+            return _SpawnedProcess.spawn(cmd)
+        return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
     def _start_python_tftp_server(self, tftp_root):
-        """Start a simple Python TFTP server in a background thread."""
-        try:
-            import tftpy
-        except ImportError:
-            raise ImportError(
-                "tftpy module not found. Install it with: pip install tftpy"
-            )
+        """
+        Start the built-in asyncio TFTP server on a background thread.
+
+        All transfers are multiplexed on one event loop, so concurrent clients
+        do not cost a thread each. No third-party packages are required.
 
-        def run_tftp():
-            server = tftpy.TftpServer(str(tftp_root))
-            server.listen("127.0.0.1", self.tftp_port)
+        The listening socket is bound here, in the calling thread, so bind
+        errors (port in use, no permission for port 69) are raised to the
+        caller and the server accepts requests as soon as this returns.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.bind(("127.0.0.1", self.tftp_port))
+        except OSError:
+            sock.close()
+            raise
 
-        thread = threading.Thread(target=run_tftp, daemon=True)
-        thread.start()
-        self.tftp_process = "python_thread"
+        self.tftp_process = _TftpServerThread(sock, tftp_root)
 
     def stop_tftp_server(self):
         """Stop the TFTP server."""
         if self.tftp_process is None:
             return
 
-        if self.tftp_process == "python_thread":
-            print("ℹ️  Python TFTP server (daemon thread) will stop on app exit")
-            return
-
         try:
             self.tftp_process.terminate()
             self.tftp_process.wait(timeout=5)
@@ -303,28 +922,20 @@ class QuantumXferBuilder:
         print("="*60 + "\n")
 
         try:
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(2)
-            
             # Send a simple TFTP read request (RRQ)
-            # TFTP RRQ packet: opcode (1) + filename + 0 + mode + 0
-            request = b'\x00\x01' + b'test_file.txt\x00' + b'octet\x00'
-            
-            sock.sendto(request, ("127.0.0.1", self.tftp_port))
-            data, addr = sock.recvfrom(512)
-            sock.close()
-            
-            if data[:2] == b'\x00\x03':  # TFTP DATA packet
+            reply = self._probe_tftp(2)
+            if reply is None:
+                print("❌ TFTP server not responding (timeout)")
+                return False
+
+            data, addr = reply
+            if len(data) >= 2 and _TFTP_OPCODE.unpack_from(data)[0] == _TFTP_DATA:
                 print("✅ TFTP server is responding correctly")
                 print(f"   Received data packet from {addr}")
                 return True
             else:
                 print("⚠️  Unexpected TFTP response")
                 return False
-        except socket.timeout:
-            print("❌ TFTP server not responding (timeout)")
-            return False
         except Exception as e:
             print(f"❌ TFTP test failed: {e}")
             return False
@@ -406,6 +1017,13 @@ Examples:
         choices=["win", "linux", "all"],
         help="Package the app for distribution (win, linux, or all)",
     )
+    parser.add_argument(
+        "--log",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Also append the output of npm/Electron commands to FILE",
+    )
     parser.add_argument(
         "--root",
         type=str,
@@ -415,21 +1033,33 @@ Examples:
 
     args = parser.parse_args()
 
+    # Check the log file up front, so an unusable path fails once with a clear message
+    if args.log:
+        try:
+            with open(args.log, "ab"):
+                pass
+        except OSError as e:
+            print(f"❌ Error: Cannot write log file {args.log}: {e}")
+            return 1
+
     try:
         builder = QuantumXferBuilder(
             project_root=args.root,
             skip_install=args.skip_install,
             skip_build=args.skip_build,
             dev_mode=args.dev,
+            log_file=args.log,
         )
 
         # Handle TFTP test-only command
         if args.test_tftp:
             return 0 if builder.test_tftp() else 1
 
-        # Start TFTP server if requested
+        # Start TFTP server if requested, probing npm in the background meanwhile
         tftp_started = False
         if args.with_tftp:
+            if not (args.package or args.run_only) and builder.needs_npm_check(args.build_only):
+                builder.prefetch_npm_version()
             tftp_started = builder.start_tftp_server()
 
         try:
@@ -466,4 +1096,10 @@ Examples:
 
 
 if __name__ == "__main__":
+    # Any future worker processes start fresh instead of forking this process,
+    # so they never inherit the TFTP sockets or the server thread's state
+    try:
+        multiprocessing.set_start_method("spawn")
+    except RuntimeError:
+        pass
     sys.exit(main())